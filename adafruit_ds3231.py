@@ -142,6 +142,7 @@ class DS3231:
 
     def __init__(self, i2c: I2C) -> None:
         self.i2c_device = I2CDevice(i2c, 0x68)
+        self._buffer = bytearray(3)
 
     @property
     def datetime(self) -> struct_time:
@@ -152,8 +153,17 @@ class DS3231:
     @datetime.setter
     def datetime(self, value: struct_time) -> None:
         self.datetime_register = value
-        self.disable_oscillator = False
-        self.lost_power = False
+        self._start_oscillator()
+
+    def _start_oscillator(self) -> None:
+        # Clear EOSC (0x0E bit 7) and OSF (0x0F bit 7) with a single
+        # read-modify-write, since the control and status registers are adjacent.
+        self._buffer[0] = 0x0E
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._buffer, self._buffer, out_end=1, in_start=1)
+            self._buffer[1] &= 0x7F
+            self._buffer[2] &= 0x7F
+            i2c.write(self._buffer)
 
     @property
     def temperature(self) -> float: